@@ -1,3 +1,6 @@
+import argparse
+import asyncio
+import json
 import logging
 import os
 import sys
@@ -29,8 +32,142 @@ def setup_logging():
     logger.debug(f"Logging initialized with level: {log_level}")
 
 
+# Параметры, которые действуют только вместе с --ddl или --batch
+SPEC_MODE_OPTIONS = {
+    'spec': '--spec',
+    'format': '--format',
+    'output_dir': '--output-dir',
+    'workers': '--workers',
+    'shards': '--shards',
+    'dry_run': '--dry-run',
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="SQL Generator")
+    parser.add_argument('--serve', action='store_true',
+                        help="Run the long-lived generation server instead of the interactive CLI.")
+    parser.add_argument('--socket', help="Unix socket path for the generation server.")
+    parser.add_argument('--host', default='127.0.0.1', help="Loopback host for the generation server (default: 127.0.0.1).")
+    parser.add_argument('--port', type=int, default=8765, help="Port for the generation server (default: 8765).")
+    parser.add_argument('--ddl', help="DDL file to generate data for without the interactive prompts (requires --spec).")
+    parser.add_argument('--spec', help="JSON generation spec with row counts and field types per table.")
+    parser.add_argument('--format', choices=['sql', 'csv'], help="Output format (default: sql).")
+    parser.add_argument('--batch', help="Directory or glob of DDL files to generate in one run (requires --spec).")
+    parser.add_argument('--output-dir', help="Output directory for --batch and --shards (default: output).")
+    parser.add_argument('--workers', type=int, help="Number of worker processes for --batch (default: CPU count).")
+    parser.add_argument('--shards', type=int,
+                        help="With --ddl: write K primary-key range shards per table and a load manifest to --output-dir.")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Only estimate output size, memory and time, and check unique constraints.")
+    return parser.parse_args()
+
+
+def run_server(args):
+    from src.core.repositories.repository_factory import create_value_repository
+    from src.interfaces.server.generation_server import GenerationServer
+
+    server = GenerationServer(create_value_repository())
+    try:
+        asyncio.run(server.serve(socket_path=args.socket, host=args.host, port=args.port))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    except KeyboardInterrupt:
+        print("Generation server stopped.")
+
+
+def run_spec(args):
+    from src.core.repositories.repository_factory import create_value_repository
+    from src.core.services.ddl_parser import DDLParser
+    from src.core.services.generation_planner import GenerationPlanner
+    from src.core.services.generation_runner import GenerationRunner
+    from src.core.services.generation_spec import GenerationSpec
+    from src.core.services.predefined_values import PredefinedValues
+    from src.core.services.shard_writer import ShardWriter
+
+    with open(args.spec, "r", encoding='utf-8') as f:
+        spec = GenerationSpec.from_dict(json.load(f))
+    parser = DDLParser(args.ddl)
+    tables = spec.apply(parser.sort_tables_by_dependencies(parser.read_file()))
+    predefined_values = PredefinedValues(create_value_repository())
+
+    if args.dry_run:
+        plan = GenerationPlanner(predefined_values, args.format).estimate(tables, spec)
+        print("\n".join(plan.format_report()))
+        if not plan.is_feasible:
+            sys.exit(1)
+        return
+
+    predefined_values.repository.seed(spec.seed)
+    if args.shards is not None:
+        manifest = ShardWriter(predefined_values, args.output_dir, args.shards, args.format).write(tables, spec)
+        for level in manifest["levels"]:
+            print(f"Level {level['level']}: " + ", ".join(table['table'] for table in level['tables']))
+        print(f"Shards and manifest written to {args.output_dir}")
+        return
+
+    for line in GenerationRunner(predefined_values, args.format).iter_lines(tables, spec):
+        print(line)
+
+
+def run_batch(args):
+    from src.core.repositories.repository_factory import create_value_repository
+    from src.core.services.batch_runner import BatchRunner
+    from src.core.services.generation_spec import GenerationSpec
+    from src.core.services.predefined_values import PredefinedValues
+
+    with open(args.spec, "r", encoding='utf-8') as f:
+        spec = GenerationSpec.from_dict(json.load(f))
+    ddl_files = BatchRunner.collect_ddl_files(args.batch)
+    if not ddl_files:
+        print(f"No DDL files found for '{args.batch}'.")
+        sys.exit(1)
+
+    runner = BatchRunner(PredefinedValues(create_value_repository()), args.output_dir, args.format, args.workers)
+    if args.dry_run:
+        plan = runner.plan(ddl_files, spec)
+        print("\n".join(plan.format_report()))
+        if not plan.is_feasible:
+            sys.exit(1)
+        return
+
+    summary = runner.run(ddl_files, spec)
+    print("\n".join(summary.format_report()))
+    if summary.failed:
+        sys.exit(1)
+
+
 def main():
+    args = parse_args()
     setup_logging()
+    if not (args.ddl or args.batch):
+        ignored = [option for name, option in SPEC_MODE_OPTIONS.items() if getattr(args, name) not in (None, False)]
+        if ignored:
+            print(f"{', '.join(ignored)} can only be used with --ddl or --batch.")
+            sys.exit(2)
+    args.format = args.format or 'sql'
+    args.output_dir = args.output_dir or 'output'
+    if args.serve:
+        run_server(args)
+        return
+    if args.ddl or args.batch:
+        if not args.spec:
+            print("--ddl and --batch require --spec.")
+            sys.exit(2)
+        if args.batch and args.shards is not None:
+            print("--shards can only be used with --ddl.")
+            sys.exit(2)
+        if args.workers is not None and args.workers < 1:
+            print("--workers must be at least 1.")
+            sys.exit(2)
+        try:
+            run_batch(args) if args.batch else run_spec(args)
+        except (ValueError, OSError) as e:
+            logging.error(f"Generation failed: {e}")
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
     cli = CLI()
     try:
         cli.run()
@@ -1,5 +1,5 @@
 # src/core/models/table.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
 # Получение логгера
@@ -13,6 +13,8 @@ class Table:
         self.foreign_keys: List[Dict[str, Any]] = []
         self.unique_columns: List[str] = []
         self.generated_rows: List[Dict[str, Any]] = []
+        self._column_values: Dict[str, List[Any]] = {}  # Индекс значений столбцов для внешних ключей
+        self._indexed_rows: Optional[List[Dict[str, Any]]] = None  # Список строк, по которому построен индекс
 
     def add_column(self, column_name: str, column_type: str) -> None:
         if column_name.lower() not in ("primary", "foreign"):
@@ -35,5 +37,21 @@ class Table:
         if column not in self.unique_columns:
             self.unique_columns.append(column)
 
+    def column_values(self, column: str) -> List[Any]:
+        """
+        Возвращает значения столбца сгенерированных строк.
+        Индекс пополняется только новыми строками и строится заново, если generated_rows заменён.
+        """
+        if self._indexed_rows is not self.generated_rows:
+            self._column_values = {}
+            self._indexed_rows = self.generated_rows
+        values = self._column_values.setdefault(column, [])
+        rows = self.generated_rows
+        if len(values) > len(rows):
+            del values[len(rows):]
+        elif len(values) < len(rows):
+            values.extend(row[column] for row in rows[len(values):])
+        return values
+
     def log_generated_rows(self):
         logger.debug(f"Generated rows for table '{self.name}': {self.generated_rows}")
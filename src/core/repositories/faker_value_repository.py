@@ -1,26 +1,57 @@
 
 import random
-from typing import List
+from typing import Any, List, Optional
 import logging
 from faker import Faker
-from src.core.repositories.value_repository import IValueRepository
+from src.core.repositories.value_repository_interface import IValueRepository, Value
 
 logger = logging.getLogger(__name__)
 
 class FakerValueRepository(IValueRepository):
+    # Все значения типов с ограниченным диапазоном; остальные типы генерируются на лету
+    bounded_values = {
+        "number [0,10]": list(range(0, 11)),
+        "number [0,10000]": list(range(0, 10001)),
+    }
+
     def __init__(self):
         self.faker = Faker()
         Faker.seed(0)  # Для воспроизводимости
 
-    def get_values(self, field_type: str) -> List[str]:
+    def get_pool_size(self, field_type: str) -> Optional[int]:
+        """
+        Faker генерирует значения на лету, поэтому ограничены только числовые диапазоны.
+        """
+        values = self.bounded_values.get(field_type.lower())
+        return len(values) if values is not None else None
+
+    def seed(self, seed: int) -> None:
+        """
+        Инициализирует как модуль random, так и генератор Faker.
+        """
+        super().seed(seed)
+        self.faker.seed_instance(seed)
+
+    def get_random_state(self) -> Any:
+        return super().get_random_state(), self.faker.random.getstate()
+
+    def set_random_state(self, state: Any) -> None:
+        random_state, faker_state = state
+        super().set_random_state(random_state)
+        self.faker.random.setstate(faker_state)
+
+    def get_values(self, field_type: str) -> List[Value]:
         """
-        В этом хранилище метод get_values не используется, так как данные генерируются на лету.
-        Возвращает пустой список.
+        Данные генерируются на лету, поэтому список значений есть только у числовых диапазонов.
+        Для остальных типов возвращает пустой список.
         """
-        logger.debug(f"get_values called for field_type '{field_type}' in FakerValueRepository. Returning empty list.")
-        return []
+        values = self.bounded_values.get(field_type.lower())
+        if values is None:
+            logger.debug(f"get_values called for field_type '{field_type}' in FakerValueRepository. Returning empty list.")
+            return []
+        return values
 
-    def get_random_value(self, field_type: str, referenced_values: List[str] = None) -> str:
+    def get_random_value(self, field_type: str, referenced_values: List[Value] = None) -> Value:
         """
         Генерирует фейковое значение для заданного типа поля.
         Если переданы referenced_values, выбирает случайное значение из них.
@@ -48,13 +79,13 @@ class FakerValueRepository(IValueRepository):
         elif field_type.lower() == "job":
             value = self.faker.job()
         elif field_type.lower() == "number [0,10]":
-            value = str(random.randint(0, 10))
+            value = random.randint(0, 10)
         elif field_type.lower() == "number [0,10000]":
-            value = str(random.randint(0, 10000))
+            value = random.randint(0, 10000)
         elif field_type.lower() == "recent date":
-            value = self.faker.date_between(start_date='-1y', end_date='today').isoformat()
+            value = self.faker.date_between(start_date='-1y', end_date='today')
         elif field_type.lower() == "date":
-            value = self.faker.date()
+            value = self.faker.date_object()
         else:
             value = "unknown_value"
             logger.warning(f"Unknown field type '{field_type}'. Generated value set to 'unknown_value'.")
@@ -0,0 +1,19 @@
+import os
+import logging
+from src.core.repositories.value_repository_interface import IValueRepository
+from src.core.repositories.value_repository import ValueRepository
+from src.core.repositories.faker_value_repository import FakerValueRepository
+
+logger = logging.getLogger(__name__)
+
+
+def create_value_repository() -> IValueRepository:
+    """
+    Создаёт хранилище значений в соответствии с переменной окружения REPOSITORY_TYPE.
+    """
+    repository_type = os.getenv('REPOSITORY_TYPE', 'FILE').upper()
+    if repository_type == 'FAKER':
+        logger.info("Using FakerValueRepository for generating fake data.")
+        return FakerValueRepository()
+    logger.info("Using ValueRepository for predefined data.")
+    return ValueRepository()
@@ -1,9 +1,10 @@
 import os
 import random
-from typing import List
+from datetime import date
+from typing import Callable, Dict, List
 import logging
 
-from core.repositories.value_repository_interface import IValueRepository
+from src.core.repositories.value_repository_interface import IValueRepository, Value
 from src.utils.file_reader import read_file
 
 # Получение логгера
@@ -28,19 +29,49 @@ class ValueRepository(IValueRepository):
         "Date": "date.txt"
     }
 
-    def get_values(self, field_type: str) -> List[str]:
+    # Преобразование строк файла в исходные типы; остальные типы полей остаются строками
+    value_parsers: Dict[str, Callable[[str], Value]] = {
+        "Number [0,10]": int,
+        "Number [0,10000]": int,
+        "Recent date": date.fromisoformat,
+        "Date": date.fromisoformat,
+    }
+
+    def __init__(self):
+        self._values_cache: Dict[str, List[Value]] = {}  # Прочитанные файлы значений по типам полей
+
+    def get_values(self, field_type: str) -> List[Value]:
         """
         Возвращает список всех значений для заданного типа поля.
+        Файл читается и преобразуется один раз, далее значения берутся из кэша.
         """
+        cached = self._values_cache.get(field_type)
+        if cached is not None:
+            return cached
         file = self.data_files.get(field_type)
         if file:
             file_path = os.path.join(self.RESOURCES_FOLDER, file)
             logger.debug(f"Reading values from {file_path} for field type '{field_type}'")
-            return read_file(file_path)
+            values = self._parse_values(field_type, read_file(file_path))
+            self._values_cache[field_type] = values
+            return values
         logger.warning(f"No data file found for field type '{field_type}'")
         return []
 
-    def get_random_value(self, field_type: str, referenced_values: List[str] = None) -> str:
+    def _parse_values(self, field_type: str, lines: List[str]) -> List[Value]:
+        parser = self.value_parsers.get(field_type)
+        if parser is None:
+            return lines
+        values = []
+        for line in lines:
+            try:
+                values.append(parser(line))
+            except ValueError:
+                logger.warning(f"Value '{line}' cannot be parsed for field type '{field_type}', keeping it as text")
+                values.append(line)
+        return values
+
+    def get_random_value(self, field_type: str, referenced_values: List[Value] = None) -> Value:
         """
         Возвращает случайное значение для заданного типа поля.
         Если переданы referenced_values, выбирает случайное значение из них.
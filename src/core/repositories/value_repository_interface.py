@@ -1,11 +1,42 @@
+import random
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date
+from typing import Any, List, Optional, Union
+
+# Значения передаются по конвейеру в исходном виде и форматируются только при выводе
+Value = Union[int, float, date, str]
 
 class IValueRepository(ABC):
     @abstractmethod
-    def get_values(self, field_type: str) -> List[str]:
+    def get_values(self, field_type: str) -> List[Value]:
         pass
 
     @abstractmethod
-    def get_random_value(self, field_type: str, referenced_values: List[str] = None) -> str:
+    def get_random_value(self, field_type: str, referenced_values: List[Value] = None) -> Value:
         pass
+
+    def get_pool_size(self, field_type: str) -> Optional[int]:
+        """
+        Возвращает количество различных значений, доступных для типа поля,
+        или None, если набор значений не ограничен.
+        """
+        values = self.get_values(field_type)
+        return len(set(values)) if values else None
+
+    def seed(self, seed: int) -> None:
+        """
+        Инициализирует генератор случайных чисел, используемый хранилищем.
+        """
+        random.seed(seed)
+
+    def get_random_state(self) -> Any:
+        """
+        Возвращает текущее состояние генератора случайных чисел хранилища.
+        """
+        return random.getstate()
+
+    def set_random_state(self, state: Any) -> None:
+        """
+        Восстанавливает состояние, полученное из get_random_state().
+        """
+        random.setstate(state)
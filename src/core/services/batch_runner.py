@@ -0,0 +1,223 @@
+import glob
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import logging
+from src.core.models.table import Table
+from src.core.services.generation_planner import GenerationPlan, GenerationPlanner
+from src.core.services.generation_runner import GenerationRunner
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.schema_cache import SchemaCache
+
+logger = logging.getLogger(__name__)
+
+# Прогретые значения текущего процесса; дочерние процессы наследуют их при fork
+_worker_values: Optional[PredefinedValues] = None
+
+
+class SchemaResult:
+    def __init__(self, ddl_path: str, output_path: str):
+        self.ddl_path = ddl_path
+        self.output_path = output_path
+        self.rows: int = 0
+        self.seconds: float = 0.0
+        self.error: Optional[str] = None
+
+
+class BatchSummary:
+    def __init__(self, results: List[SchemaResult], wall_seconds: float):
+        self.results = results
+        self.wall_seconds = wall_seconds
+
+    @property
+    def failed(self) -> List[SchemaResult]:
+        return [result for result in self.results if result.error]
+
+    def format_report(self) -> List[str]:
+        lines = [f"{'Schema':<32}{'Rows':>12}{'Time':>10}  Output"]
+        for result in self.results:
+            output = f"ERROR {result.error}" if result.error else result.output_path
+            lines.append(f"{result.ddl_path:<32}{result.rows:>12}{result.seconds:>9.2f}s  {output}")
+        sum_seconds = sum(result.seconds for result in self.results)
+        lines.append(f"{'Total':<32}{sum(r.rows for r in self.results):>12}{sum_seconds:>9.2f}s  (sum of schemas)")
+        lines.append(f"{'Wall clock':<32}{'':>12}{self.wall_seconds:>9.2f}s")
+        return lines
+
+
+class BatchPlan:
+    def __init__(self, plans: Dict[str, GenerationPlan], errors: Dict[str, str]):
+        self.plans = plans
+        self.errors = errors  # Схемы, которые не удалось разобрать
+
+    @property
+    def is_feasible(self) -> bool:
+        return not self.errors and all(plan.is_feasible for plan in self.plans.values())
+
+    def format_report(self) -> List[str]:
+        lines = []
+        for ddl_path in sorted([*self.plans, *self.errors]):
+            lines.append(f"Schema: {ddl_path}")
+            if ddl_path in self.errors:
+                lines.append(f"ERROR {self.errors[ddl_path]}")
+            else:
+                lines.extend(self.plans[ddl_path].format_report())
+        return lines
+
+
+def _run_schema(tables: List[Table], spec: GenerationSpec, output_format: str,
+                ddl_path: str, output_path: str) -> SchemaResult:
+    """
+    Генерирует данные одной схемы в собственный файл. Выполняется в рабочем процессе.
+    """
+    result = SchemaResult(ddl_path, output_path)
+    start = time.perf_counter()
+    try:
+        _worker_values.repository.seed(spec.seed)
+        runner = GenerationRunner(_worker_values, output_format)
+        with open(output_path, "w", encoding='utf-8') as f:
+            for line in runner.iter_lines(tables, spec):
+                f.write(line + "\n")
+        result.rows = sum(spec.rows_for(table.name) for table in tables)
+    except (ValueError, OSError) as e:
+        logger.error(f"Ошибка генерации для '{ddl_path}': {e}")
+        result.error = str(e)
+    except Exception as e:
+        # Непредвиденная ошибка одной схемы не должна прерывать весь пакет
+        logger.exception(f"Непредвиденная ошибка генерации для '{ddl_path}'")
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+class BatchRunner:
+    """
+    Пакетная генерация для множества DDL-файлов.
+
+    Каждая схема обрабатывается в собственном пространстве имён (свои таблицы,
+    уникальные значения и внешние ключи). Хранилище значений прогревается один раз
+    и наследуется рабочими процессами при fork; разобранные схемы кэшируются в SchemaCache.
+    Там, где fork недоступен, схемы обрабатываются последовательно в текущем процессе.
+    """
+
+    def __init__(self, predefined_values: PredefinedValues, output_dir: str, output_format: str = 'sql',
+                 workers: Optional[int] = None, schema_cache: Optional[SchemaCache] = None):
+        if workers is not None and workers < 1:
+            raise ValueError("Количество рабочих процессов должно быть положительным.")
+        self.predefined_values = predefined_values
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.schema_cache = schema_cache or SchemaCache()
+
+    @staticmethod
+    def collect_ddl_files(pattern: str) -> List[str]:
+        """
+        Принимает каталог (берутся все *.ddl) или glob-шаблон.
+        """
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.ddl")
+        return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+    @staticmethod
+    def schema_names(ddl_files: List[str]) -> Dict[str, str]:
+        """
+        Возвращает имя схемы для каждого DDL-файла: путь относительно общего каталога
+        с разделителем "/", например "shop/schema.ddl". По нему ищутся настройки в разделе "schemas".
+        """
+        if not ddl_files:
+            return {}
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in ddl_files])
+        return {path: os.path.relpath(os.path.abspath(path), root).replace(os.sep, '/') for path in ddl_files}
+
+    @classmethod
+    def output_names(cls, ddl_files: List[str]) -> Dict[str, str]:
+        """
+        Возвращает имя выходного файла (без расширения) для каждого DDL-файла.
+        Имя повторяет имя схемы, поэтому одноимённые файлы
+        из разных каталогов (например, resources/*/*.ddl) не перезаписывают друг друга.
+        """
+        return {path: os.path.splitext(os.path.normpath(name))[0] for path, name in cls.schema_names(ddl_files).items()}
+
+    def _load_jobs(self, ddl_files: List[str], spec: GenerationSpec) -> Tuple[List[tuple], List[SchemaResult]]:
+        """
+        Разбирает DDL-файлы и возвращает задания для рабочих процессов и результаты с ошибками разбора.
+        """
+        results: List[SchemaResult] = []
+        jobs = []
+        schema_names = self.schema_names(ddl_files)
+        output_names = self.output_names(ddl_files)
+        for ddl_path in ddl_files:
+            schema_spec = spec.for_schema(schema_names[ddl_path])
+            output_path = os.path.join(self.output_dir, f"{output_names[ddl_path]}.{self.output_format}")
+            try:
+                with open(ddl_path, "r", encoding='utf-8') as f:
+                    tables = self.schema_cache.get_tables(f.read(), schema_spec)
+            except (ValueError, OSError) as e:
+                logger.error(f"Ошибка разбора '{ddl_path}': {e}")
+                result = SchemaResult(ddl_path, output_path)
+                result.error = str(e)
+                results.append(result)
+                continue
+            jobs.append((tables, schema_spec, self.output_format, ddl_path, output_path))
+        return jobs, results
+
+    def plan(self, ddl_files: List[str], spec: GenerationSpec) -> BatchPlan:
+        """
+        Оценивает каждую схему пакета без генерации данных (dry-run).
+        """
+        jobs, failed = self._load_jobs(ddl_files, spec)
+        planner = GenerationPlanner(self.predefined_values, self.output_format)
+        plans = {job[3]: planner.estimate(job[0], job[1]) for job in jobs}
+        return BatchPlan(plans, {result.ddl_path: result.error for result in failed})
+
+    def run(self, ddl_files: List[str], spec: GenerationSpec) -> BatchSummary:
+        global _worker_values
+        _worker_values = self.predefined_values
+        start = time.perf_counter()
+
+        jobs, results = self._load_jobs(ddl_files, spec)
+
+        # Выполнимость проверяется для всех схем до запуска первой: невыполнимая схема
+        # не должна обнаруживаться только после того, как отработали самые большие
+        planner = GenerationPlanner(self.predefined_values, self.output_format)
+        feasible_jobs = []
+        for job in jobs:
+            try:
+                planner.check_feasibility(job[0], job[1])
+                os.makedirs(os.path.dirname(job[4]), exist_ok=True)
+            except (ValueError, OSError) as e:
+                result = SchemaResult(job[3], job[4])
+                result.error = str(e)
+                results.append(result)
+                continue
+            feasible_jobs.append(job)
+        jobs = feasible_jobs
+
+        # Загружаем наборы значений до fork, чтобы рабочие процессы получили их готовыми
+        for field_type in {col_type for job in jobs for table in job[0] for col_type in table.columns.values()}:
+            self.predefined_values.repository.get_values(field_type)
+
+        # Самые большие схемы запускаются первыми, чтобы общее время было близко к времени самой большой
+        jobs.sort(key=lambda job: sum(job[1].rows_for(table.name) for table in job[0]), reverse=True)
+
+        if self.workers > 1 and len(jobs) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = [executor.submit(_run_schema, *job) for job in jobs]
+                for job, future in zip(jobs, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        # Например, рабочий процесс завершился аварийно; ошибка относится только к этой схеме
+                        logger.error(f"Рабочий процесс не завершил '{job[3]}': {e}")
+                        result = SchemaResult(job[3], job[4])
+                        result.error = f"{type(e).__name__}: {e}"
+                        results.append(result)
+        else:
+            results.extend(_run_schema(*job) for job in jobs)
+
+        results.sort(key=lambda result: result.ddl_path)
+        return BatchSummary(results, time.perf_counter() - start)
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import Dict, List
 import logging
 from src.core.models.table import Table
 
@@ -7,13 +7,21 @@ from src.core.models.table import Table
 logger = logging.getLogger(__name__)
 
 class DDLParser:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str = None):
         self.file_path = file_path
 
     def read_file(self) -> List[Table]:
         with open(self.file_path, "r", encoding='utf-8') as f:
             lines = f.readlines()
+        return self.parse_lines(lines)
 
+    def parse_text(self, ddl_text: str) -> List[Table]:
+        """
+        Разбирает DDL, переданный строкой, а не путём к файлу.
+        """
+        return self.parse_lines(ddl_text.splitlines())
+
+    def parse_lines(self, lines: List[str]) -> List[Table]:
         tables: List[Table] = []
         current_table: Table = None
 
@@ -119,3 +127,20 @@ class DDLParser:
                 logger.error("Обнаружена циклическая зависимость или отсутствуют ссылки на таблицы.")
                 break  # Предотвращаем бесконечный цикл в случае циклических зависимостей
         return sorted_tables
+
+    def group_tables_by_level(self, sorted_tables: List[Table]) -> List[List[Table]]:
+        """
+        Группирует отсортированные таблицы по уровням зависимостей.
+        Уровень 0 - таблицы без внешних ключей; таблица уровня N ссылается только на таблицы уровней < N,
+        поэтому таблицы одного уровня можно загружать одновременно.
+        """
+        levels: Dict[str, int] = {}
+        grouped: List[List[Table]] = []
+        for table in sorted_tables:
+            level = max((levels.get(fk['referenced_table'], -1) + 1 for fk in table.foreign_keys), default=0)
+            levels[table.name] = level
+            while len(grouped) <= level:
+                grouped.append([])
+            grouped[level].append(table)
+            logger.debug(f"Таблица '{table.name}' отнесена к уровню зависимостей {level}")
+        return grouped
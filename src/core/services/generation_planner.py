@@ -0,0 +1,222 @@
+import copy
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+from src.core.models.table import Table
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.sql_generator import SQLGenerator
+from src.utils.csv_formatter import to_csv_line
+
+logger = logging.getLogger(__name__)
+
+
+class TableEstimate:
+    def __init__(self, table_name: str, rows: int):
+        self.table_name = table_name
+        self.rows = rows
+        self.output_bytes: int = 0
+        self.retained_bytes: int = 0  # Строки, индексы внешних ключей и множества уникальных значений
+        self.seconds: float = 0.0
+        self.issues: List[str] = []
+
+
+class GenerationPlan:
+    def __init__(self, estimates: List[TableEstimate]):
+        self.estimates = estimates
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(estimate.output_bytes for estimate in self.estimates)
+
+    @property
+    def peak_memory_bytes(self) -> int:
+        # Сгенерированные строки и уникальные значения хранятся до конца прогона
+        return sum(estimate.retained_bytes for estimate in self.estimates)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(estimate.seconds for estimate in self.estimates)
+
+    @property
+    def issues(self) -> List[str]:
+        return [issue for estimate in self.estimates for issue in estimate.issues]
+
+    @property
+    def is_feasible(self) -> bool:
+        return not self.issues
+
+    def format_report(self) -> List[str]:
+        lines = [f"{'Table':<24}{'Rows':>12}{'Output':>12}{'Retained':>12}{'Time':>10}"]
+        for estimate in self.estimates:
+            lines.append(
+                f"{estimate.table_name:<24}{estimate.rows:>12}{format_bytes(estimate.output_bytes):>12}"
+                f"{format_bytes(estimate.retained_bytes):>12}{estimate.seconds:>9.2f}s"
+            )
+        lines.append(
+            f"{'Total':<24}{sum(e.rows for e in self.estimates):>12}{format_bytes(self.total_bytes):>12}"
+            f"{format_bytes(self.peak_memory_bytes):>12}{self.total_seconds:>9.2f}s"
+        )
+        if self.issues:
+            lines.append("Infeasible requests:")
+            lines.extend(f"  - {issue}" for issue in self.issues)
+        return lines
+
+
+def format_bytes(size: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class GenerationPlanner:
+    """
+    Оценивает прогон генерации без его выполнения (dry-run):
+    объём вывода, удерживаемую память, время и выполнимость уникальных ограничений.
+    """
+
+    SAMPLE_ROWS = 50  # Строк на таблицу для калибровки по реальным генераторам
+    SET_ENTRY_BYTES = 32  # Примерные накладные расходы на элемент множества уникальных значений
+    INDEX_ENTRY_BYTES = 8  # Ссылка на значение в индексе столбца для внешних ключей
+
+    def __init__(self, predefined_values: PredefinedValues, output_format: str = 'sql', sample_rows: int = SAMPLE_ROWS):
+        self.predefined_values = predefined_values
+        self.output_format = output_format
+        self.sample_rows = sample_rows
+
+    def find_infeasible(self, tables: List[Table], spec: GenerationSpec) -> Dict[str, List[str]]:
+        """
+        Возвращает проблемы по таблицам: уникальные столбцы, для которых не хватает значений,
+        и внешние ключи, ссылающиеся на таблицы без строк.
+        Уникальный внешний ключ ограничен значениями родительской таблицы, остальные столбцы -
+        набором значений типа поля.
+        """
+        issues: Dict[str, List[str]] = {table.name: [] for table in tables}
+        tables_by_name = {table.name: table for table in tables}
+
+        for table in tables:
+            rows = spec.rows_for(table.name)
+            for fk in table.foreign_keys:
+                if rows > 0 and spec.rows_for(fk['referenced_table']) <= 0:
+                    issues[table.name].append(
+                        f"{table.name}.{fk['column']}: таблица '{fk['referenced_table']}' не содержит строк для внешнего ключа."
+                    )
+
+            for col_name, col_type in table.columns.items():
+                if col_name not in table.unique_columns and col_name not in table.primary_keys:
+                    continue
+                fk = next((fk for fk in table.foreign_keys if fk['column'] == col_name), None)
+                if fk:
+                    pool_size = self._referenced_pool_size(fk, tables_by_name, spec)
+                    source = f"таблица '{fk['referenced_table']}'"
+                else:
+                    pool_size = self.predefined_values.repository.get_pool_size(col_type)
+                    source = f"тип '{col_type}'"
+                if pool_size is not None and rows > pool_size:
+                    issues[table.name].append(
+                        f"{table.name}.{col_name}: требуется {rows} уникальных значений, "
+                        f"а {source} даёт только {pool_size}."
+                    )
+        return issues
+
+    def _referenced_pool_size(self, fk: Dict[str, str], tables_by_name: Dict[str, Table],
+                              spec: GenerationSpec) -> Optional[int]:
+        """
+        Оценивает число различных значений родительского столбца, доступных внешнему ключу.
+        """
+        parent_rows = spec.rows_for(fk['referenced_table'])
+        parent = tables_by_name.get(fk['referenced_table'])
+        if parent is None:
+            return None
+        column = fk['referenced_column']
+        if column in parent.unique_columns or column in parent.primary_keys or column not in parent.columns:
+            return parent_rows
+        parent_pool = self.predefined_values.repository.get_pool_size(parent.columns[column])
+        return parent_rows if parent_pool is None else min(parent_rows, parent_pool)
+
+    def check_feasibility(self, tables: List[Table], spec: GenerationSpec) -> None:
+        issues = [issue for table_issues in self.find_infeasible(tables, spec).values() for issue in table_issues]
+        if issues:
+            logger.error(f"Невыполнимый запрос на генерацию: {issues}")
+            raise ValueError("Невыполнимый запрос на генерацию: " + " ".join(issues))
+
+    def estimate(self, tables: List[Table], spec: GenerationSpec) -> GenerationPlan:
+        """
+        Калибрует генераторы на небольшой выборке строк и экстраполирует на запрошенные объёмы.
+        Переданные таблицы и общее состояние генератора случайных чисел не изменяются.
+        """
+        issues = self.find_infeasible(tables, spec)
+        estimates: List[TableEstimate] = []
+
+        repository = self.predefined_values.repository
+        saved_state = repository.get_random_state()
+        repository.seed(spec.seed)
+        try:
+            sample_tables = copy.deepcopy(tables)
+            sql_generator = SQLGenerator(self.predefined_values)
+            referenced_tables: Dict[str, Table] = {}
+            indexed_columns = {(fk['referenced_table'], fk['referenced_column'])
+                               for table in sample_tables for fk in table.foreign_keys}
+            skipped: Set[str] = set()  # Таблицы без калибровки: у зависимых от них нет строк для внешних ключей
+            for table in sample_tables:
+                estimate = TableEstimate(table.name, spec.rows_for(table.name))
+                estimate.issues = issues[table.name]
+                if estimate.issues or any(fk['referenced_table'] in skipped for fk in table.foreign_keys):
+                    skipped.add(table.name)
+                else:
+                    index_columns = [col for col in table.columns if (table.name, col) in indexed_columns]
+                    self._calibrate(estimate, table, sql_generator, referenced_tables, index_columns)
+                    if estimate.issues:
+                        skipped.add(table.name)
+                referenced_tables[table.name] = table
+                estimates.append(estimate)
+        finally:
+            repository.set_random_state(saved_state)
+
+        return GenerationPlan(estimates)
+
+    def _calibrate(self, estimate: TableEstimate, table: Table, sql_generator: SQLGenerator,
+                   referenced_tables: Dict[str, Table], index_columns: List[str]) -> None:
+        sample_rows = min(self.sample_rows, estimate.rows)
+        if sample_rows <= 0:
+            return
+        try:
+            output_bytes, retained_bytes, elapsed = self._sample(table, sql_generator, referenced_tables,
+                                                                 index_columns, sample_rows)
+            seconds_per_row = elapsed / sample_rows
+        except ValueError as e:
+            estimate.issues.append(f"{table.name}: ошибка при калибровке: {e}")
+            return
+
+        scale = estimate.rows / sample_rows
+        estimate.output_bytes = int(output_bytes * scale)
+        estimate.retained_bytes = int(retained_bytes * scale)
+        estimate.seconds = seconds_per_row * estimate.rows
+        if self.output_format == 'csv':
+            header = f"# table: {table.name}\n" + to_csv_line(list(table.columns.keys())) + "\n"
+            estimate.output_bytes += len(header.encode('utf-8'))
+        logger.debug(f"Калибровка '{table.name}': {sample_rows} строк за {elapsed:.4f} с")
+
+    def _sample(self, table: Table, sql_generator: SQLGenerator, referenced_tables: Dict[str, Table],
+                index_columns: List[str], sample_rows: int) -> Tuple[int, int, float]:
+        """
+        Генерирует sample_rows строк и возвращает байты вывода, удерживаемые байты и затраченное время.
+        index_columns - столбцы, на которые ссылаются внешние ключи других таблиц.
+        """
+        unique_columns = [col for col in table.columns if col in table.unique_columns or col in table.primary_keys]
+        output_bytes = 0
+        retained_bytes = 0
+        start = time.perf_counter()
+        for _ in range(sample_rows):
+            if self.output_format == 'sql':
+                line = sql_generator.generate_insert_query(table, referenced_tables)
+            else:
+                line = to_csv_line(list(sql_generator.generate_row(table, referenced_tables).values()))
+            output_bytes += len(line.encode('utf-8')) + 1
+            row = table.generated_rows[-1]
+            retained_bytes += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+            retained_bytes += sum(sys.getsizeof(row[col]) + self.SET_ENTRY_BYTES for col in unique_columns)
+            retained_bytes += self.INDEX_ENTRY_BYTES * len(index_columns)
+        return output_bytes, retained_bytes, time.perf_counter() - start
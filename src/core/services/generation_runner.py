@@ -0,0 +1,50 @@
+from typing import Dict, Iterator, List
+import logging
+from src.core.models.table import Table
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.generation_planner import GenerationPlanner
+from src.core.services.sql_generator import SQLGenerator
+from src.utils.csv_formatter import to_csv_line
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ('sql', 'csv')
+
+
+class GenerationRunner:
+    """
+    Генерирует строки для набора отсортированных таблиц по спецификации без участия пользователя.
+    """
+
+    def __init__(self, predefined_values: PredefinedValues, output_format: str = 'sql'):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Неизвестный формат вывода '{output_format}'. Допустимые: {', '.join(OUTPUT_FORMATS)}")
+        self.predefined_values = predefined_values
+        self.output_format = output_format
+
+    def iter_lines(self, tables: List[Table], spec: GenerationSpec) -> Iterator[str]:
+        """
+        Лениво выдаёт строки вывода: INSERT-запросы или CSV.
+        В формате CSV каждая таблица начинается со строки '# table: <имя>' и заголовка.
+        Невыполнимые запросы отклоняются до генерации первой строки.
+        """
+        GenerationPlanner(self.predefined_values, self.output_format).check_feasibility(tables, spec)
+        sql_generator = SQLGenerator(self.predefined_values)
+        referenced_tables: Dict[str, Table] = {}
+
+        for table in tables:
+            num_rows = spec.rows_for(table.name)
+            logger.info(f"Генерация {num_rows} строк для таблицы '{table.name}'")
+            if self.output_format == 'csv':
+                yield f"# table: {table.name}"
+                yield to_csv_line(list(table.columns.keys()))
+
+            for _ in range(num_rows):
+                if self.output_format == 'sql':
+                    yield sql_generator.generate_insert_query(table, referenced_tables)
+                else:
+                    row = sql_generator.generate_row(table, referenced_tables)
+                    yield to_csv_line(list(row.values()))
+
+            referenced_tables[table.name] = table
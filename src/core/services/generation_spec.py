@@ -0,0 +1,162 @@
+from typing import Any, Dict, List, Optional
+import logging
+from src.core.models.table import Table
+
+logger = logging.getLogger(__name__)
+
+# Типы полей, для которых хранилища значений умеют генерировать данные
+FIELD_TYPES = [
+    "Last name",
+    "First name",
+    "Address",
+    "Postal code",
+    "City",
+    "Country",
+    "Phone",
+    "Email",
+    "Job",
+    "Number [0,10]",
+    "Number [0,10000]",
+    "Recent date",
+    "Date",
+]
+
+
+def determine_field_type_for_fk(referenced_column_type: str) -> str:
+    """
+    Определяет тип поля для внешнего ключа по типу столбца, на который он ссылается.
+    """
+    referenced_column_type_lower = referenced_column_type.lower()
+    if 'int' in referenced_column_type_lower:
+        return "Number [0,10000]"
+    elif 'varchar' in referenced_column_type_lower or 'char' in referenced_column_type_lower:
+        return "Number [0,10000]"  # Можно заменить на другой тип при необходимости
+    else:
+        return "Number [0,10000]"  # По умолчанию
+
+
+def validate_spec_data(data: Any, name: str) -> None:
+    """
+    Проверяет структуру спецификации (или раздела из "schemas") до её использования.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{name}: ожидается JSON-объект.")
+    if 'default_rows' in data:
+        validate_row_count(data['default_rows'], f"{name}.default_rows")
+    seed = data.get('seed')
+    if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+        raise ValueError(f"{name}.seed: ожидается целое число.")
+
+    tables = data.get('tables', {})
+    if not isinstance(tables, dict):
+        raise ValueError(f"{name}.tables: ожидается JSON-объект с таблицами.")
+    for table_name, table_spec in tables.items():
+        if not isinstance(table_spec, dict):
+            raise ValueError(f"{name}.tables.{table_name}: ожидается JSON-объект.")
+        if 'rows' in table_spec:
+            validate_row_count(table_spec['rows'], f"{name}.tables.{table_name}.rows")
+        columns = table_spec.get('columns', {})
+        if not isinstance(columns, dict) or not all(isinstance(field_type, str) for field_type in columns.values()):
+            raise ValueError(f"{name}.tables.{table_name}.columns: ожидается объект 'столбец: тип поля'.")
+
+
+def validate_row_count(value: Any, name: str) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"{name}: ожидается неотрицательное целое число.")
+
+
+class GenerationSpec:
+    """
+    Неинтерактивное описание генерации: количество строк и типы полей по таблицам.
+
+    Формат (JSON):
+        {
+            "seed": 42,
+            "default_rows": 10,
+            "tables": {
+                "Customers": {"rows": 100, "columns": {"first_name": "First name"}}
+            },
+            "schemas": {
+                "store.ddl": {"seed": 1, "tables": {...}},
+                "shop/schema.ddl": {"default_rows": 5}
+            }
+        }
+    Типы внешних ключей определяются автоматически, как и в режиме DDL в CLI.
+    Необязательный раздел "schemas" задаёт настройки для отдельных DDL-файлов в пакетном режиме.
+    """
+
+    def __init__(self, tables: Dict[str, Dict[str, Any]], default_rows: int = 10, seed: Optional[int] = None,
+                 schemas: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.tables = tables
+        self.default_rows = default_rows
+        self.seed = seed
+        self.schemas = schemas or {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GenerationSpec":
+        """
+        Создаёт спецификацию из JSON-данных; при неверной структуре выбрасывает ValueError.
+        """
+        validate_spec_data(data, "спецификация")
+        schemas = data.get('schemas', {})
+        if not isinstance(schemas, dict):
+            raise ValueError("Раздел 'schemas' должен быть JSON-объектом.")
+        for schema_name, schema_data in schemas.items():
+            validate_spec_data(schema_data, f"schemas.{schema_name}")
+        return cls(
+            tables=data.get('tables', {}),
+            default_rows=data.get('default_rows', 10),
+            seed=data.get('seed'),
+            schemas=schemas,
+        )
+
+    def for_schema(self, schema_name: str) -> "GenerationSpec":
+        """
+        Возвращает спецификацию для DDL-файла: настройки из "schemas" дополняют общие.
+        schema_name - путь к файлу относительно общего каталога пакета, например "shop/schema.ddl".
+        """
+        schema_data = self.schemas.get(schema_name, {})
+        tables = dict(self.tables)
+        for table_name, table_spec in schema_data.get('tables', {}).items():
+            # Настройки таблицы объединяются по полям: "rows" заменяется, "columns" дополняются
+            base_spec = self.tables.get(table_name, {})
+            tables[table_name] = {
+                **base_spec,
+                **table_spec,
+                'columns': {**base_spec.get('columns', {}), **table_spec.get('columns', {})},
+            }
+        return GenerationSpec(
+            tables=tables,
+            default_rows=schema_data.get('default_rows', self.default_rows),
+            seed=schema_data.get('seed', self.seed),
+        )
+
+    def rows_for(self, table_name: str) -> int:
+        return int(self.tables.get(table_name, {}).get('rows', self.default_rows))
+
+    def apply(self, tables: List[Table]) -> List[Table]:
+        """
+        Проставляет типы полей для столбцов отсортированных таблиц; неизвестный тип поля вызывает ValueError.
+        Таблицы изменяются на месте и возвращаются для удобства.
+        """
+        columns_by_table = {table.name: dict(table.columns) for table in tables}
+        for table in tables:
+            table_spec = self.tables.get(table.name, {}).get('columns', {})
+            for column_name in table.columns.keys():
+                fk = next((fk for fk in table.foreign_keys if fk['column'] == column_name), None)
+                if fk:
+                    referenced_column_type = columns_by_table.get(fk['referenced_table'], {}).get(fk['referenced_column'])
+                    if referenced_column_type:
+                        table.columns[column_name] = determine_field_type_for_fk(referenced_column_type)
+                        continue
+                    logger.warning(f"Не найден столбец '{fk['referenced_table']}.{fk['referenced_column']}' для внешнего ключа '{column_name}'.")
+
+                field_type = table_spec.get(column_name)
+                if not field_type:
+                    raise ValueError(f"Не задан тип поля для столбца '{table.name}.{column_name}'.")
+                if field_type not in FIELD_TYPES:
+                    raise ValueError(f"Неизвестный тип поля '{field_type}' для столбца '{table.name}.{column_name}'. "
+                                     f"Допустимые: {', '.join(FIELD_TYPES)}")
+                table.columns[column_name] = field_type
+                logger.debug(f"Установлен тип поля '{field_type}' для '{table.name}.{column_name}'")
+        return tables
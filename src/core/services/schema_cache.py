@@ -0,0 +1,66 @@
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import List, Optional
+import logging
+from src.core.models.table import Table
+from src.core.services.ddl_parser import DDLParser
+from src.core.services.generation_spec import GenerationSpec
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaCache:
+    """
+    Кэш разобранных DDL и таблиц с применённой спецификацией.
+    Каждый вызов get_tables() возвращает независимую копию, которую можно заполнять строками.
+
+    Оба кэша ограничены max_entries записями и вытесняют давно не использованные (LRU),
+    а ключами служат хэши текста, поэтому долгоживущий сервер не накапливает входные данные клиентов.
+    """
+
+    MAX_ENTRIES = 64  # Записей в каждом кэше
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._schema_cache: "OrderedDict[str, List[Table]]" = OrderedDict()
+        self._plan_cache: "OrderedDict[str, List[Table]]" = OrderedDict()
+
+    def get_schema(self, ddl_text: str) -> List[Table]:
+        key = text_hash(ddl_text)
+        schema = self._get(self._schema_cache, key)
+        if schema is None:
+            parser = DDLParser()
+            schema = parser.sort_tables_by_dependencies(parser.parse_text(ddl_text))
+            self._put(self._schema_cache, key, schema)
+            logger.info(f"Закэширована схема из {len(schema)} таблиц.")
+        return schema
+
+    def get_tables(self, ddl_text: str, spec: GenerationSpec) -> List[Table]:
+        """
+        Возвращает отсортированные таблицы с типами полей из спецификации.
+        Разбор DDL и применение спецификации выполняются один раз для каждой пары DDL / спецификация.
+        """
+        plan_key = text_hash(ddl_text + "\0" + json.dumps(spec.tables, sort_keys=True))
+        plan = self._get(self._plan_cache, plan_key)
+        if plan is None:
+            plan = spec.apply(copy.deepcopy(self.get_schema(ddl_text)))
+            self._put(self._plan_cache, plan_key, plan)
+        return copy.deepcopy(plan)
+
+    def _get(self, cache: "OrderedDict[str, List[Table]]", key: str) -> Optional[List[Table]]:
+        tables = cache.get(key)
+        if tables is not None:
+            cache.move_to_end(key)
+        return tables
+
+    def _put(self, cache: "OrderedDict[str, List[Table]]", key: str, tables: List[Table]) -> None:
+        cache[key] = tables
+        cache.move_to_end(key)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
@@ -0,0 +1,91 @@
+import json
+import os
+from typing import Any, Dict, List
+import logging
+from src.core.models.table import Table
+from src.core.services.ddl_parser import DDLParser
+from src.core.services.generation_planner import GenerationPlanner
+from src.core.services.generation_runner import OUTPUT_FORMATS
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.sql_generator import SQLGenerator
+from src.utils.csv_formatter import to_csv_line
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+class ShardWriter:
+    """
+    Записывает данные в виде шардов для параллельной загрузки.
+
+    Строки каждой таблицы делятся на shard_count файлов по диапазонам первичного ключа.
+    Таблицы группируются по уровням зависимостей: внешние ключи таблицы уровня N
+    ссылаются только на таблицы уровней < N. Все шарды одного уровня можно загружать
+    одновременно, после того как загружены все предыдущие уровни; порядок описан в manifest.json.
+    """
+
+    def __init__(self, predefined_values: PredefinedValues, output_dir: str, shard_count: int,
+                 output_format: str = 'sql'):
+        if shard_count < 1:
+            raise ValueError("Количество шардов должно быть положительным.")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Неизвестный формат вывода '{output_format}'. Допустимые: {', '.join(OUTPUT_FORMATS)}")
+        self.predefined_values = predefined_values
+        self.output_dir = output_dir
+        self.shard_count = shard_count
+        self.output_format = output_format
+
+    def write(self, tables: List[Table], spec: GenerationSpec) -> Dict[str, Any]:
+        """
+        Генерирует отсортированные таблицы, записывает шарды и манифест. Возвращает манифест.
+        """
+        GenerationPlanner(self.predefined_values, self.output_format).check_feasibility(tables, spec)
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        sql_generator = SQLGenerator(self.predefined_values)
+        referenced_tables: Dict[str, Table] = {}
+        manifest: Dict[str, Any] = {"format": self.output_format, "shards": self.shard_count, "levels": []}
+
+        for level, level_tables in enumerate(DDLParser().group_tables_by_level(tables)):
+            level_entry = {"level": level, "tables": []}
+            for table in level_tables:
+                num_rows = spec.rows_for(table.name)
+                logger.info(f"Генерация {num_rows} строк для таблицы '{table.name}' (уровень {level})")
+                for _ in range(num_rows):
+                    sql_generator.generate_row(table, referenced_tables)
+                referenced_tables[table.name] = table
+
+                level_entry["tables"].append({
+                    "table": table.name,
+                    "depends_on": sorted({fk['referenced_table'] for fk in table.foreign_keys}),
+                    "files": self._write_shards(sql_generator, table, level),
+                })
+            manifest["levels"].append(level_entry)
+
+        with open(os.path.join(self.output_dir, MANIFEST_FILE), "w", encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, default=str)
+        return manifest
+
+    def _write_shards(self, sql_generator: SQLGenerator, table: Table, level: int) -> List[Dict[str, Any]]:
+        primary_keys = [key for key in table.primary_keys if key in table.columns]
+        files = []
+        for shard_index, rows in enumerate(sql_generator.partition_rows(table, self.shard_count)):
+            file_name = f"{level:02d}_{table.name}_{shard_index:03d}.{self.output_format}"
+            with open(os.path.join(self.output_dir, file_name), "w", encoding='utf-8') as f:
+                if self.output_format == 'csv':
+                    f.write(to_csv_line(list(table.columns.keys())) + "\n")
+                for row in rows:
+                    if self.output_format == 'sql':
+                        f.write(sql_generator.build_insert_query(table, row) + "\n")
+                    else:
+                        f.write(to_csv_line(list(row.values())) + "\n")
+
+            file_entry: Dict[str, Any] = {"shard": shard_index, "path": file_name, "rows": len(rows)}
+            if primary_keys and rows:
+                file_entry["primary_key"] = primary_keys
+                file_entry["min"] = [rows[0][key] for key in primary_keys]
+                file_entry["max"] = [rows[-1][key] for key in primary_keys]
+            files.append(file_entry)
+        return files
@@ -1,7 +1,10 @@
 # src/core/services/sql_generator.py
-from typing import Dict
+import random
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 import logging
 from src.core.models.table import Table
+from src.core.repositories.value_repository_interface import Value
 from src.core.services.predefined_values import PredefinedValues
 
 # Получение логгера
@@ -10,7 +13,9 @@ logger = logging.getLogger(__name__)
 class SQLGenerator:
     def __init__(self, predefined_values: PredefinedValues):
         self.predefined_values = predefined_values
-        self.unique_values: Dict[str, set] = {}  # Для хранения уникальных значений по столбцам
+        self.unique_values: Dict[Tuple[str, str], set] = {}  # Уникальные значения по (таблица, столбец)
+        self._field_kinds: Dict[str, str] = {}
+        self._date_literals: Dict[Value, str] = {}  # SQL-литерал для каждой встреченной даты
 
     def is_numeric_field(self, field_type: str) -> bool:
         """
@@ -28,38 +33,57 @@ class SQLGenerator:
         field_type_upper = field_type.upper()
         return any(keyword in field_type_upper for keyword in date_keywords)
 
-    def format_value(self, field_type: str, value: str) -> str:
+    def field_kind(self, field_type: str) -> str:
         """
-        Форматирует значение на основе типа поля.
-        - Числовые типы: Без кавычек.
-        - Даты: Использовать to_date('value', 'YYYY-MM-DD').
-        - Другие типы: Обрамлять в кавычки.
+        Возвращает вид поля ('numeric', 'date' или 'string'); результат кэшируется по типу поля.
         """
-        if self.is_numeric_field(field_type):
-            logger.debug(f"Поле '{field_type}' является числовым. Значение: {value}")
-            return value.strip("'")  # Без кавычек
-        elif self.is_date_field(field_type):
-            logger.debug(f"Поле '{field_type}' является датой. Значение: {value}")
-            stripped_value = value.strip("'")
-            return f"to_date('{stripped_value}', 'YYYY-MM-DD')"
-        else:
-            logger.debug(f"Поле '{field_type}' является строковым. Значение: {value}")
-            stripped_value = value.strip("'")
-            return f"'{stripped_value}'"
+        kind = self._field_kinds.get(field_type)
+        if kind is None:
+            if self.is_numeric_field(field_type):
+                kind = 'numeric'
+            elif self.is_date_field(field_type):
+                kind = 'date'
+            else:
+                kind = 'string'
+            self._field_kinds[field_type] = kind
+        return kind
 
-    def generate_insert_query(self, table: Table, referenced_tables: Dict[str, Table]) -> str:
-        insert_columns = []
-        values = []
+    def format_value(self, field_type: str, value: Value) -> str:
+        """
+        Единственный шаг преобразования значения в SQL-литерал, выполняется при выводе.
+        - Числовые типы: Без кавычек.
+        - Даты: Использовать to_date('value', 'YYYY-MM-DD'); литерал кэшируется для каждой даты.
+        - Другие типы: Обрамлять в кавычки, кавычки внутри значения удваиваются.
+        """
+        kind = self.field_kind(field_type)
+        if kind == 'date' or isinstance(value, date):
+            literal = self._date_literals.get(value)
+            if literal is None:
+                literal = f"to_date({quote_sql_string(value)}, 'YYYY-MM-DD')"
+                self._date_literals[value] = literal
+            return literal
+        if kind == 'numeric':
+            return str(value)
+        return quote_sql_string(value)
+
+    def generate_row(self, table: Table, referenced_tables: Dict[str, Table]) -> Dict[str, Value]:
+        """
+        Генерирует одну строку таблицы с учётом внешних ключей и уникальности.
+        Строка сохраняется в table.generated_rows с исходными (неформатированными) значениями
+        и возвращается.
+        """
+        row: Dict[str, Value] = {}
 
         for col_name, col_type in table.columns.items():
+            referenced_values = None
             # Проверка, является ли столбец внешним ключом
             fk = next((fk for fk in table.foreign_keys if fk['column'] == col_name), None)
             if fk:
                 referenced_table = referenced_tables.get(fk['referenced_table'])
                 if referenced_table and referenced_table.generated_rows:
                     # Извлекаем значения из столбца, на который ссылается внешний ключ
-                    referenced_values = [row[fk['referenced_column']] for row in referenced_table.generated_rows]
-                    logger.debug(f"Генерация значения внешнего ключа для '{col_name}' из '{fk['referenced_table']}.{fk['referenced_column']}' с доступными значениями: {referenced_values}")
+                    referenced_values = referenced_table.column_values(fk['referenced_column'])
+                    logger.debug(f"Генерация значения внешнего ключа для '{col_name}' из '{fk['referenced_table']}.{fk['referenced_column']}' ({len(referenced_values)} доступных значений)")
                     value = self.predefined_values.get_value(col_type, referenced_values)
                 else:
                     # Обработка отсутствия сгенерированных значений для внешнего ключа
@@ -70,76 +94,96 @@ class SQLGenerator:
                 logger.debug(f"Генерация значения для '{col_name}' с типом поля '{col_type}'")
                 value = self.predefined_values.get_value(col_type)
 
-            # Форматирование значения
-            formatted_value = self.format_value(col_type, value)
-
             # Проверка уникальности, если столбец уникален или является первичным ключом
             if col_name in table.unique_columns or col_name in table.primary_keys:
-                if col_name not in self.unique_values:
-                    self.unique_values[col_name] = set()
-                attempts = 0
-                max_attempts = 1000
-                original_value = formatted_value
-                while formatted_value in self.unique_values[col_name]:
-                    value = self.predefined_values.get_value(col_type)
-                    formatted_value = self.format_value(col_type, value)
-                    attempts += 1
-                    if attempts > max_attempts:
-                        logger.error(f"Невозможно сгенерировать уникальное значение для столбца '{col_name}' после {max_attempts} попыток.")
-                        raise ValueError(f"Невозможно сгенерировать уникальное значение для столбца '{col_name}'.")
-                self.unique_values[col_name].add(formatted_value)
-                if attempts > 0:
-                    logger.debug(f"Сгенерировано новое уникальное значение для '{col_name}': {formatted_value}")
-
-            insert_columns.append(col_name)
-            values.append(formatted_value)
-
-        columns_str = ", ".join(insert_columns)
-        values_str = ", ".join(values)
+                value = self._ensure_unique(table, col_name, col_type, value, referenced_values)
 
-        query = f"INSERT INTO {table.name} ({columns_str}) VALUES ({values_str});"
-        logger.info(f"Сгенерированный SQL-запрос: {query}")
+            row[col_name] = value
 
         # Сохраняем сгенерированные значения для использования в других таблицах
-        table.generated_rows.append(dict(zip(insert_columns, values)))
+        table.generated_rows.append(row)
 
+        return row
+
+    def build_insert_query(self, table: Table, row: Dict[str, Value]) -> str:
+        columns_str = ", ".join(row.keys())
+        values_str = ", ".join(self.format_value(table.columns[col_name], value) for col_name, value in row.items())
+
+        query = f"INSERT INTO {table.name} ({columns_str}) VALUES ({values_str});"
+        logger.info(f"Сгенерированный SQL-запрос: {query}")
         return query
 
+    def generate_insert_query(self, table: Table, referenced_tables: Dict[str, Table]) -> str:
+        return self.build_insert_query(table, self.generate_row(table, referenced_tables))
+
+    def partition_rows(self, table: Table, shard_count: int) -> List[List[Dict[str, Value]]]:
+        """
+        Делит сгенерированные строки таблицы на shard_count частей по диапазонам первичного ключа.
+        Строки сортируются по первичному ключу (без него - сохраняется порядок генерации)
+        и разбиваются на непрерывные диапазоны примерно равного размера.
+        """
+        rows = table.generated_rows
+        primary_keys = [key for key in table.primary_keys if key in table.columns]
+        if primary_keys:
+            rows = sorted(rows, key=lambda row: tuple(row[key] for key in primary_keys))
+        shard_size, remainder = divmod(len(rows), shard_count)
+        shards = []
+        start = 0
+        for shard_index in range(shard_count):
+            end = start + shard_size + (1 if shard_index < remainder else 0)
+            shards.append(rows[start:end])
+            start = end
+        return shards
+
+    def _ensure_unique(self, table: Table, col_name: str, col_type: str, value: Value,
+                       referenced_values: Optional[List[Value]] = None) -> Value:
+        """
+        Перегенерирует значение, пока оно не станет уникальным для столбца таблицы.
+        Для внешнего ключа новые значения выбираются только из referenced_values,
+        чтобы ссылка оставалась на существующую строку родительской таблицы.
+        Если случайные попытки исчерпаны, значение выбирается из ещё не использованных
+        значений набора, поэтому запрос не больше размера набора всегда выполним.
+        """
+        used_values = self.unique_values.setdefault((table.name, col_name), set())
+        attempts = 0
+        max_attempts = 1000
+        while value in used_values:
+            attempts += 1
+            if attempts > max_attempts:
+                value = self._pick_unused_value(table, col_name, col_type, used_values, referenced_values)
+                break
+            value = self.predefined_values.get_value(col_type, referenced_values)
+        used_values.add(value)
+        if attempts > 0:
+            logger.debug(f"Сгенерировано новое уникальное значение для '{col_name}': {value}")
+        return value
+
+    def _pick_unused_value(self, table: Table, col_name: str, col_type: str, used_values: set,
+                           referenced_values: Optional[List[Value]]) -> Value:
+        pool = referenced_values if referenced_values else self.predefined_values.repository.get_values(col_type)
+        unused_values = [value for value in dict.fromkeys(pool) if value not in used_values]
+        if not unused_values:
+            logger.error(f"Невозможно сгенерировать уникальное значение для столбца '{table.name}.{col_name}': все значения использованы.")
+            raise ValueError(f"Невозможно сгенерировать уникальное значение для столбца '{table.name}.{col_name}'.")
+        logger.debug(f"Случайные попытки исчерпаны для '{table.name}.{col_name}', выбор из {len(unused_values)} неиспользованных значений")
+        return random.choice(unused_values)
+
     def generate_insert_query_manual(self, table: Table) -> str:
-        insert_columns = []
-        values = []
+        row: Dict[str, Value] = {}
 
         for col_name, col_type in table.columns.items():
             value = self.predefined_values.get_value(col_type)
-            formatted_value = self.format_value(col_type, value)
 
             # Проверка уникальности, если столбец уникален или является первичным ключом
             if col_name in table.unique_columns or col_name in table.primary_keys:
-                if col_name not in self.unique_values:
-                    self.unique_values[col_name] = set()
-                attempts = 0
-                max_attempts = 1000
-                original_value = formatted_value
-                while formatted_value in self.unique_values[col_name]:
-                    value = self.predefined_values.get_value(col_type)
-                    formatted_value = self.format_value(col_type, value)
-                    attempts += 1
-                    if attempts > max_attempts:
-                        logger.error(f"Невозможно сгенерировать уникальное значение для столбца '{col_name}' после {max_attempts} попыток.")
-                        raise ValueError(f"Невозможно сгенерировать уникальное значение для столбца '{col_name}'.")
-                self.unique_values[col_name].add(formatted_value)
-                if attempts > 0:
-                    logger.debug(f"Сгенерировано новое уникальное значение для '{col_name}': {formatted_value}")
-
-            insert_columns.append(col_name)
-            values.append(formatted_value)
-
-        columns_str = ", ".join(insert_columns)
-        values_str = ", ".join(values)
+                value = self._ensure_unique(table, col_name, col_type, value)
 
-        query = f"INSERT INTO {table.name} ({columns_str}) VALUES ({values_str});"
-        logger.info(f"Сгенерированный SQL-запрос: {query}")
+            row[col_name] = value
 
-        table.generated_rows.append(dict(zip(insert_columns, values)))
+        table.generated_rows.append(row)
 
-        return query
+        return self.build_insert_query(table, row)
+
+
+def quote_sql_string(value: Value) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
@@ -5,22 +5,15 @@ import re
 from src.core.services.ddl_parser import DDLParser
 from src.core.services.sql_generator import SQLGenerator
 from src.core.services.predefined_values import PredefinedValues
-from src.core.repositories.value_repository import ValueRepository
-from src.core.repositories.faker_value_repository import FakerValueRepository
+from src.core.services.generation_spec import FIELD_TYPES, determine_field_type_for_fk
+from src.core.repositories.repository_factory import create_value_repository
 from src.core.models.table import Table
 
 logger = logging.getLogger(__name__)
 
 class CLI:
     def __init__(self):
-        repository_type = os.getenv('REPOSITORY_TYPE', 'FILE').upper()
-        if repository_type == 'FAKER':
-            repository = FakerValueRepository()
-            logger.info("Using FakerValueRepository for generating fake data.")
-        else:
-            repository = ValueRepository()
-            logger.info("Using ValueRepository for predefined data.")
-
+        repository = create_value_repository()
         predefined_values = PredefinedValues(repository)
         self.sql_generator = SQLGenerator(predefined_values)
 
@@ -214,28 +207,8 @@ class CLI:
         """
         Determines the field type for a foreign key based on the referenced column type.
         """
-        referenced_column_type_lower = referenced_column_type.lower()
-        if 'int' in referenced_column_type_lower:
-            return "Number [0,10000]"
-        elif 'varchar' in referenced_column_type_lower or 'char' in referenced_column_type_lower:
-            return "Number [0,10000]"  # Can change to another type if needed
-        else:
-            return "Number [0,10000]"  # Default
+        return determine_field_type_for_fk(referenced_column_type)
 
     def get_available_field_types(self) -> list:
         """Returns a list of available field types."""
-        return [
-            "Last name",
-                "First name",
-                "Address",
-                "Postal code",
-                "City",
-                "Country",
-                "Phone",
-                "Email",
-                "Job",
-                "Number [0,10]",
-                "Number [0,10000]",
-                "Recent date",
-                "Date"
-        ]
+        return list(FIELD_TYPES)
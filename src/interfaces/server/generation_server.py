@@ -0,0 +1,133 @@
+import asyncio
+import ipaddress
+import json
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterator, Optional, Tuple
+from src.core.repositories.value_repository_interface import IValueRepository
+from src.core.services.generation_planner import GenerationPlanner
+from src.core.services.generation_runner import OUTPUT_FORMATS, GenerationRunner
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.schema_cache import SchemaCache
+
+logger = logging.getLogger(__name__)
+
+
+def is_loopback_host(host: str) -> bool:
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class GenerationServer:
+    """
+    Долгоживущий asyncio-сервис генерации.
+
+    Держит в памяти прогретое хранилище значений (файловые наборы / Faker), разобранные
+    схемы и применённые планы таблиц и обслуживает множество клиентов из одного состояния.
+
+    Протокол: клиент отправляет одну JSON-строку
+        {"ddl": "...", "spec": {...}, "seed": 42, "format": "sql"}
+    (вместо "ddl" можно передать "ddl_path", "dry_run": true возвращает отчёт
+    планировщика вместо данных) и получает сгенерированные строки до закрытия соединения.
+    Ошибки передаются одной строкой "ERROR <сообщение>".
+    """
+
+    CHUNK_ROWS = 200  # Строк, генерируемых между двумя записями клиенту
+    REQUEST_LIMIT = 16 * 1024 * 1024  # Максимальный размер строки запроса (встроенные DDL и спецификация)
+
+    def __init__(self, repository: IValueRepository):
+        self.repository = repository
+        self.predefined_values = PredefinedValues(repository)
+        self.schema_cache = SchemaCache()
+
+    def parse_request(self, request: Dict[str, Any]) -> Tuple[Iterator[str], Optional[int]]:
+        if 'ddl' in request:
+            ddl_text = request['ddl']
+        elif 'ddl_path' in request:
+            with open(request['ddl_path'], "r", encoding='utf-8') as f:
+                ddl_text = f.read()
+        else:
+            raise ValueError("Запрос должен содержать 'ddl' или 'ddl_path'.")
+
+        spec = GenerationSpec.from_dict(request.get('spec', {}))
+        # Сид запроса важнее сида спецификации и для генерации, и для оценки
+        spec.seed = request.get('seed', spec.seed)
+        output_format = request.get('format', 'sql')
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Неизвестный формат вывода '{output_format}'. Допустимые: {', '.join(OUTPUT_FORMATS)}")
+        if request.get('dry_run'):
+            plan = GenerationPlanner(self.predefined_values, output_format).estimate(self.schema_cache.get_tables(ddl_text, spec), spec)
+            return iter(plan.format_report()), spec.seed
+        runner = GenerationRunner(self.predefined_values, output_format)
+        return runner.iter_lines(self.schema_cache.get_tables(ddl_text, spec), spec), spec.seed
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            if not isinstance(request, dict):
+                raise ValueError("Запрос должен быть JSON-объектом.")
+            lines, seed = self.parse_request(request)
+            await self.stream_lines(writer, lines, seed)
+        except (ValueError, OSError) as e:
+            logger.error(f"Ошибка обработки запроса на генерацию: {e}")
+            writer.write(f"ERROR {e}\n".encode('utf-8'))
+        except Exception as e:
+            # Граница соединения: клиент всегда получает строку ERROR, сервер продолжает работу
+            logger.exception("Непредвиденная ошибка обработки запроса на генерацию.")
+            writer.write(f"ERROR {type(e).__name__}: {e}\n".encode('utf-8'))
+        finally:
+            try:
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def stream_lines(self, writer: asyncio.StreamWriter, lines: Iterator[str], seed: Optional[int]) -> None:
+        """
+        Пишет строки клиенту порциями, ожидая drain() для обратного давления.
+
+        Параллельные запросы используют одно хранилище, поэтому каждый запрос хранит
+        собственное состояние генератора случайных чисел и подставляет его только на время генерации своей порции.
+        """
+        state = self._initial_random_state(seed)
+        while True:
+            saved_state = self.repository.get_random_state()
+            self.repository.set_random_state(state)
+            try:
+                chunk = list(islice(lines, self.CHUNK_ROWS))
+            finally:
+                state = self.repository.get_random_state()
+                self.repository.set_random_state(saved_state)
+            if not chunk:
+                break
+            writer.write(("\n".join(chunk) + "\n").encode('utf-8'))
+            await writer.drain()
+
+    def _initial_random_state(self, seed: Optional[int]) -> Any:
+        """
+        Строит начальное состояние генератора случайных чисел для запроса, не затрагивая общее.
+        """
+        saved_state = self.repository.get_random_state()
+        self.repository.seed(seed)
+        state = self.repository.get_random_state()
+        self.repository.set_random_state(saved_state)
+        return state
+
+    async def serve(self, socket_path: Optional[str] = None, host: str = '127.0.0.1', port: int = 8765) -> None:
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=socket_path, limit=self.REQUEST_LIMIT)
+            logger.info(f"Сервер генерации слушает unix-сокет {socket_path}")
+        else:
+            if not is_loopback_host(host):
+                # Запросы могут читать произвольные файлы через ddl_path, поэтому только локальные подключения
+                raise ValueError(f"Сервер генерации принимает подключения только на loopback-адресах, получен '{host}'.")
+            server = await asyncio.start_server(self.handle_client, host, port, limit=self.REQUEST_LIMIT)
+            logger.info(f"Сервер генерации слушает {host}:{port}")
+        async with server:
+            await server.serve_forever()
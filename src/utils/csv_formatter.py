@@ -0,0 +1,12 @@
+import csv
+import io
+from typing import Any, List
+
+
+def to_csv_line(values: List[Any]) -> str:
+    """
+    Записывает значения одной строкой CSV; экранирование выполняет модуль csv.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='').writerow(values)
+    return buffer.getvalue()
@@ -0,0 +1,24 @@
+import random
+from datetime import date, timedelta
+from typing import List
+from src.core.repositories.value_repository_interface import IValueRepository, Value
+
+
+class StubValueRepository(IValueRepository):
+    """
+    Детерминированное хранилище для тестов: не требует Faker и файлов ресурсов.
+    """
+
+    def get_values(self, field_type: str) -> List[Value]:
+        if field_type == "Number [0,10]":
+            return list(range(0, 11))
+        if field_type == "Number [0,10000]":
+            return list(range(0, 10001))
+        if field_type in ("Date", "Recent date"):
+            return [date(2020, 1, 1) + timedelta(days=i) for i in range(365)]
+        return [f"{field_type} {i}" for i in range(100)]
+
+    def get_random_value(self, field_type: str, referenced_values: List[Value] = None) -> Value:
+        if referenced_values:
+            return random.choice(referenced_values)
+        return random.choice(self.get_values(field_type))
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.core.services import batch_runner
+from src.core.services.batch_runner import BatchRunner
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from test.stub_repository import StubValueRepository
+
+DDL = """
+CREATE TABLE T (
+    id INT PRIMARY KEY
+);
+"""
+SPEC = GenerationSpec.from_dict({"default_rows": 2, "tables": {"T": {"columns": {"id": "Number [0,10000]"}}}})
+
+
+class BatchRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.ddl_files = []
+        for folder in ("shop", "school"):
+            os.makedirs(os.path.join(self.temp_dir.name, "resources", folder))
+            path = os.path.join(self.temp_dir.name, "resources", folder, "schema.ddl")
+            with open(path, "w", encoding='utf-8') as f:
+                f.write(DDL)
+            self.ddl_files.append(path)
+        self.output_dir = os.path.join(self.temp_dir.name, "output")
+
+    def runner(self) -> BatchRunner:
+        return BatchRunner(PredefinedValues(StubValueRepository()), self.output_dir, 'csv', workers=1)
+
+    def test_output_names_keep_relative_path_for_duplicate_stems(self):
+        names = BatchRunner.output_names(self.ddl_files)
+
+        self.assertEqual(sorted(names.values()), [os.path.join("school", "schema"), os.path.join("shop", "schema")])
+        self.assertEqual(BatchRunner.output_names(["a/x.ddl", "a/y.ddl"]), {"a/x.ddl": "x", "a/y.ddl": "y"})
+
+    def test_schema_overrides_are_keyed_by_relative_path(self):
+        spec = GenerationSpec.from_dict({"default_rows": 2, "tables": {"T": {"columns": {"id": "Number [0,10000]"}}},
+                                         "schemas": {"shop/schema.ddl": {"tables": {"T": {"rows": 5}}}}})
+
+        summary = self.runner().run(self.ddl_files, spec)
+
+        self.assertEqual({result.ddl_path: result.rows for result in summary.results},
+                         {self.ddl_files[0]: 5, self.ddl_files[1]: 2})
+
+    def test_non_positive_workers_are_rejected(self):
+        for workers in (0, -1):
+            with self.subTest(workers=workers):
+                with self.assertRaises(ValueError):
+                    BatchRunner(PredefinedValues(StubValueRepository()), self.output_dir, workers=workers)
+
+    def test_duplicate_stems_are_written_to_separate_files(self):
+        summary = self.runner().run(self.ddl_files, SPEC)
+
+        self.assertEqual(summary.failed, [])
+        self.assertEqual(len({result.output_path for result in summary.results}), 2)
+        for result in summary.results:
+            self.assertTrue(os.path.isfile(result.output_path))
+
+    def test_unexpected_error_is_recorded_for_the_schema(self):
+        with mock.patch("src.core.services.batch_runner.GenerationRunner.iter_lines", side_effect=RuntimeError("boom")):
+            with self.assertLogs("src.core.services.batch_runner", level="ERROR"):
+                summary = self.runner().run(self.ddl_files, SPEC)
+
+        self.assertEqual([result.error for result in summary.results], ["RuntimeError: boom"] * 2)
+
+    def add_infeasible_schema(self) -> GenerationSpec:
+        path = os.path.join(self.temp_dir.name, "resources", "shop", "small.ddl")
+        with open(path, "w", encoding='utf-8') as f:
+            f.write(DDL)
+        self.ddl_files.append(path)
+        return GenerationSpec.from_dict({"default_rows": 2, "tables": {"T": {"columns": {"id": "Number [0,10000]"}}},
+                                         "schemas": {"shop/small.ddl": {"tables": {"T": {
+                                             "rows": 20, "columns": {"id": "Number [0,10]"}}}}}})
+
+    def test_infeasible_schema_is_rejected_before_any_job_runs(self):
+        spec = self.add_infeasible_schema()
+
+        with mock.patch("src.core.services.batch_runner._run_schema", wraps=batch_runner._run_schema) as run_schema:
+            with self.assertLogs("src.core.services.generation_planner", level="ERROR"):
+                summary = self.runner().run(self.ddl_files, spec)
+
+        self.assertEqual([result.ddl_path for result in summary.failed], [self.ddl_files[2]])
+        self.assertEqual(sorted(call.args[3] for call in run_schema.call_args_list), sorted(self.ddl_files[:2]))
+        self.assertFalse(os.path.exists(summary.failed[0].output_path))
+
+    def test_plan_writes_nothing_and_reports_infeasible_schemas(self):
+        spec = self.add_infeasible_schema()
+
+        plan = self.runner().plan(self.ddl_files, spec)
+
+        self.assertFalse(plan.is_feasible)
+        self.assertEqual(sorted(plan.plans), sorted(self.ddl_files))
+        self.assertIn("Infeasible requests:", plan.format_report())
+        self.assertFalse(os.path.exists(self.output_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
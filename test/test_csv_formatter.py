@@ -0,0 +1,12 @@
+import unittest
+from datetime import date
+from src.utils.csv_formatter import to_csv_line
+
+
+class ToCsvLineTest(unittest.TestCase):
+    def test_native_values_are_written_without_sql_quoting(self):
+        self.assertEqual(to_csv_line(["O'Connor", 'a,"b', date(2020, 1, 2), 3]), 'O\'Connor,"a,""b",2020-01-02,3')
+
+
+if __name__ == '__main__':
+    unittest.main()
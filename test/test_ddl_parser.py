@@ -0,0 +1,39 @@
+import unittest
+from src.core.services.ddl_parser import DDLParser
+
+DDL = """
+CREATE TABLE Loans (
+    loan_id INT PRIMARY KEY,
+    book_id INT,
+    FOREIGN KEY (book_id) REFERENCES Books(book_id)
+);
+
+CREATE TABLE Authors (
+    author_id INT PRIMARY KEY
+);
+
+CREATE TABLE Books (
+    book_id INT PRIMARY KEY,
+    author_id INT,
+    FOREIGN KEY (author_id) REFERENCES Authors(author_id)
+);
+
+CREATE TABLE Borrowers (
+    borrower_id INT PRIMARY KEY
+);
+"""
+
+
+class DDLParserTest(unittest.TestCase):
+    def test_group_tables_by_level(self):
+        parser = DDLParser()
+        sorted_tables = parser.sort_tables_by_dependencies(parser.parse_text(DDL))
+
+        levels = parser.group_tables_by_level(sorted_tables)
+
+        self.assertEqual([[table.name for table in level] for level in levels],
+                         [["Authors", "Borrowers"], ["Books"], ["Loans"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from src.core.services.ddl_parser import DDLParser
+from src.core.services.generation_planner import GenerationPlanner
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from test.stub_repository import StubValueRepository
+
+DDL = """
+CREATE TABLE Departments (
+    department_id INT PRIMARY KEY,
+    department_name VARCHAR(100)
+);
+
+CREATE TABLE Managers (
+    department_id INT PRIMARY KEY,
+    FOREIGN KEY (department_id) REFERENCES Departments(department_id)
+);
+"""
+
+
+def make_spec(departments: int, managers: int) -> GenerationSpec:
+    return GenerationSpec.from_dict({"tables": {
+        "Departments": {"rows": departments, "columns": {"department_id": "Number [0,10]", "department_name": "Job"}},
+        "Managers": {"rows": managers},
+    }})
+
+
+class FindInfeasibleTest(unittest.TestCase):
+    def setUp(self):
+        self.parser = DDLParser()
+        self.planner = GenerationPlanner(PredefinedValues(StubValueRepository()))
+
+    def tables(self, spec: GenerationSpec):
+        return spec.apply(self.parser.sort_tables_by_dependencies(self.parser.parse_text(DDL)))
+
+    def test_demand_equal_to_pool_is_feasible(self):
+        spec = make_spec(11, 11)
+
+        issues = self.planner.find_infeasible(self.tables(spec), spec)
+
+        self.assertEqual(issues, {"Departments": [], "Managers": []})
+
+    def test_demand_above_field_type_pool_is_reported(self):
+        spec = make_spec(12, 5)
+
+        issues = self.planner.find_infeasible(self.tables(spec), spec)
+
+        self.assertEqual(len(issues["Departments"]), 1)
+        self.assertIn("Departments.department_id", issues["Departments"][0])
+
+    def test_unique_foreign_key_is_limited_by_parent_rows(self):
+        spec = make_spec(5, 6)
+
+        issues = self.planner.find_infeasible(self.tables(spec), spec)
+
+        self.assertEqual(issues["Departments"], [])
+        self.assertEqual(len(issues["Managers"]), 1)
+        self.assertIn("'Departments'", issues["Managers"][0])
+
+    def test_foreign_key_to_empty_table_is_reported(self):
+        spec = make_spec(0, 3)
+
+        issues = self.planner.find_infeasible(self.tables(spec), spec)
+
+        self.assertIn("не содержит строк", issues["Managers"][0])
+
+    def test_children_of_infeasible_tables_are_not_calibrated(self):
+        spec = make_spec(12, 5)
+
+        plan = self.planner.estimate(self.tables(spec), spec)
+
+        self.assertEqual(len(plan.issues), 1)
+        self.assertEqual(plan.estimates[1].issues, [])
+
+    def test_foreign_key_index_is_counted_in_retained_memory(self):
+        spec = make_spec(10, 0)
+        spec.seed = 1
+        planner = GenerationPlanner(PredefinedValues(StubValueRepository()), sample_rows=10)
+        tables = self.tables(spec)
+        with_index = planner.estimate(tables, spec).estimates[0].retained_bytes
+        tables[1].foreign_keys = []
+
+        without_index = planner.estimate(tables, spec).estimates[0].retained_bytes
+
+        self.assertEqual(with_index - without_index, 10 * GenerationPlanner.INDEX_ENTRY_BYTES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.core.services.generation_planner import GenerationPlan
+from src.interfaces.server.generation_server import GenerationServer, is_loopback_host
+from test.stub_repository import StubValueRepository
+
+DDL = """
+CREATE TABLE Customers (
+    customer_id INT PRIMARY KEY,
+    first_name VARCHAR(50)
+);
+"""
+
+
+class GenerationServerTest(unittest.TestCase):
+    def request(self, request_data: dict) -> str:
+        async def run() -> str:
+            with tempfile.TemporaryDirectory() as socket_dir:
+                socket_path = os.path.join(socket_dir, "server.sock")
+                server = await asyncio.start_unix_server(GenerationServer(StubValueRepository()).handle_client,
+                                                         path=socket_path, limit=GenerationServer.REQUEST_LIMIT)
+                async with server:
+                    reader, writer = await asyncio.open_unix_connection(socket_path)
+                    writer.write((json.dumps(request_data) + "\n").encode('utf-8'))
+                    await writer.drain()
+                    response = await reader.read()
+                    writer.close()
+                    await writer.wait_closed()
+                return response.decode('utf-8')
+
+        return asyncio.run(run())
+
+    def test_is_loopback_host(self):
+        self.assertTrue(is_loopback_host("127.0.0.1"))
+        self.assertTrue(is_loopback_host("::1"))
+        self.assertTrue(is_loopback_host("localhost"))
+        self.assertFalse(is_loopback_host("0.0.0.0"))
+        self.assertFalse(is_loopback_host("example.com"))
+
+    def test_generates_rows(self):
+        response = self.request({"ddl": DDL, "seed": 1, "spec": {"tables": {"Customers": {"rows": 3, "columns": {
+            "customer_id": "Number [0,10000]", "first_name": "First name"}}}}})
+
+        self.assertEqual(response.count("INSERT INTO Customers"), 3)
+
+    def test_large_inline_request_is_accepted(self):
+        ddl = DDL + "-- padding\n" * 20000
+        response = self.request({"ddl": ddl, "spec": {"tables": {"Customers": {"rows": 1, "columns": {
+            "customer_id": "Number [0,10000]", "first_name": "First name"}}}}})
+
+        self.assertIn("INSERT INTO Customers", response)
+
+    def test_malformed_spec_returns_error_line(self):
+        response = self.request({"ddl": DDL, "spec": {"tables": []}})
+
+        self.assertTrue(response.startswith("ERROR "))
+
+    def test_unknown_field_type_returns_error_line(self):
+        response = self.request({"ddl": DDL, "spec": {"tables": {"Customers": {"columns": {
+            "customer_id": "Number [0,10000]", "first_name": "Frist name"}}}}})
+
+        self.assertTrue(response.startswith("ERROR "))
+        self.assertIn("Frist name", response)
+
+    def test_dry_run_uses_request_seed(self):
+        server = GenerationServer(StubValueRepository())
+        with mock.patch("src.interfaces.server.generation_server.GenerationPlanner.estimate",
+                        return_value=GenerationPlan([])) as estimate:
+            _, seed = server.parse_request({"ddl": DDL, "seed": 7, "dry_run": True, "spec": {"seed": 1, "tables": {
+                "Customers": {"columns": {"customer_id": "Number [0,10000]", "first_name": "First name"}}}}})
+
+        self.assertEqual(seed, 7)
+        self.assertEqual(estimate.call_args.args[1].seed, 7)
+
+    def test_unknown_format_returns_error_line(self):
+        for dry_run in (False, True):
+            with self.subTest(dry_run=dry_run):
+                response = self.request({"ddl": DDL, "format": "xml", "dry_run": dry_run})
+
+                self.assertTrue(response.startswith("ERROR "))
+                self.assertIn("xml", response)
+
+if __name__ == '__main__':
+    unittest.main()
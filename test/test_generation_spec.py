@@ -0,0 +1,73 @@
+import unittest
+from src.core.models.table import Table
+from src.core.services.generation_spec import GenerationSpec
+
+
+class GenerationSpecFromDictTest(unittest.TestCase):
+    def test_valid_spec(self):
+        spec = GenerationSpec.from_dict({
+            "seed": 3,
+            "default_rows": 5,
+            "tables": {"T": {"rows": 2, "columns": {"id": "Number [0,10]"}}},
+            "schemas": {"x.ddl": {"seed": 4}},
+        })
+
+        self.assertEqual(spec.rows_for("T"), 2)
+        self.assertEqual(spec.rows_for("Other"), 5)
+        self.assertEqual(spec.for_schema("x.ddl").seed, 4)
+
+    def test_schema_override_is_merged_per_table(self):
+        spec = GenerationSpec.from_dict({
+            "tables": {"T": {"rows": 2, "columns": {"id": "Number [0,10]", "name": "City"}}},
+            "schemas": {"x.ddl": {"tables": {"T": {"rows": 5, "columns": {"name": "Country"}}}}},
+        })
+
+        schema_spec = spec.for_schema("x.ddl")
+
+        self.assertEqual(schema_spec.rows_for("T"), 5)
+        self.assertEqual(schema_spec.tables["T"]["columns"], {"id": "Number [0,10]", "name": "Country"})
+        self.assertEqual(spec.tables["T"]["rows"], 2)
+
+    def test_malformed_specs_raise_value_error(self):
+        malformed = [
+            [],
+            {"tables": []},
+            {"tables": {"T": []}},
+            {"tables": {"T": {"rows": "10"}}},
+            {"tables": {"T": {"rows": -1}}},
+            {"tables": {"T": {"columns": ["id"]}}},
+            {"tables": {"T": {"columns": {"id": 5}}}},
+            {"default_rows": None},
+            {"seed": "abc"},
+            {"schemas": []},
+            {"schemas": {"x.ddl": {"default_rows": True}}},
+        ]
+        for data in malformed:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    GenerationSpec.from_dict(data)
+
+
+
+class GenerationSpecApplyTest(unittest.TestCase):
+    def make_table(self) -> Table:
+        table = Table("T")
+        table.add_column("id", "INT")
+        table.add_column("name", "VARCHAR(50)")
+        return table
+
+    def test_field_types_are_applied(self):
+        spec = GenerationSpec.from_dict({"tables": {"T": {"columns": {"id": "Number [0,10]", "name": "First name"}}}})
+
+        tables = spec.apply([self.make_table()])
+
+        self.assertEqual(tables[0].columns, {"id": "Number [0,10]", "name": "First name"})
+
+    def test_unknown_field_type_raises_value_error(self):
+        spec = GenerationSpec.from_dict({"tables": {"T": {"columns": {"id": "Number [0,10]", "name": "Frist name"}}}})
+
+        with self.assertRaisesRegex(ValueError, "Frist name"):
+            spec.apply([self.make_table()])
+
+if __name__ == '__main__':
+    unittest.main()
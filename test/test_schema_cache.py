@@ -0,0 +1,41 @@
+import unittest
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.schema_cache import SchemaCache
+
+SPEC = GenerationSpec.from_dict({"tables": {"T": {"columns": {"id": "Number [0,10000]"}}}})
+
+
+def make_ddl(table_name: str) -> str:
+    return f"CREATE TABLE {table_name} (\n    id INT PRIMARY KEY\n);\n"
+
+
+class SchemaCacheTest(unittest.TestCase):
+    def test_cached_schema_is_reused(self):
+        cache = SchemaCache()
+
+        self.assertIs(cache.get_schema(make_ddl("T")), cache.get_schema(make_ddl("T")))
+
+    def test_get_tables_returns_independent_copies(self):
+        cache = SchemaCache()
+        first = cache.get_tables(make_ddl("T"), SPEC)
+        first[0].generated_rows.append({"id": 1})
+
+        self.assertEqual(cache.get_tables(make_ddl("T"), SPEC)[0].generated_rows, [])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = SchemaCache(max_entries=2)
+        first = cache.get_schema(make_ddl("A"))
+        cache.get_schema(make_ddl("B"))
+        cache.get_schema(make_ddl("A"))
+        cache.get_schema(make_ddl("C"))
+
+        self.assertIs(cache.get_schema(make_ddl("A")), first)
+        self.assertEqual(len(cache._schema_cache), 2)
+        for table_name in ("D", "E", "F"):
+            cache.get_tables(make_ddl(table_name), GenerationSpec.from_dict({"tables": {table_name: {
+                "columns": {"id": "Number [0,10000]"}}}}))
+        self.assertEqual(len(cache._plan_cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
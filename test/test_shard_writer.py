@@ -0,0 +1,63 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from src.core.services.ddl_parser import DDLParser
+from src.core.services.generation_spec import GenerationSpec
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.shard_writer import MANIFEST_FILE, ShardWriter
+from test.stub_repository import StubValueRepository
+
+DDL_DIR = os.path.join(os.path.dirname(__file__), '..', 'resources', 'ddl')
+
+COMPANY_SPEC = {
+    "seed": 1,
+    "tables": {
+        "Employees": {"rows": 60, "columns": {
+            "employee_id": "Number [0,10000]", "first_name": "First name", "last_name": "Last name",
+            "department_id": "Number [0,10]", "salary": "Number [0,10000]", "hire_date": "Date"}},
+        "Departments": {"rows": 11, "columns": {"department_id": "Number [0,10]", "department_name": "Job"}},
+        "Projects": {"rows": 40, "columns": {
+            "project_id": "Number [0,10000]", "project_name": "Job", "start_date": "Date", "end_date": "Date"}},
+        "EmployeeProjects": {"rows": 30, "columns": {}},
+    },
+}
+
+
+class ShardWriterTest(unittest.TestCase):
+    def test_company_child_fk_values_exist_in_parent_shards(self):
+        spec = GenerationSpec.from_dict(COMPANY_SPEC)
+        parser = DDLParser(os.path.join(DDL_DIR, 'company.ddl'))
+        tables = spec.apply(parser.sort_tables_by_dependencies(parser.read_file()))
+        repository = StubValueRepository()
+        repository.seed(spec.seed)
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            manifest = ShardWriter(PredefinedValues(repository), output_dir, 3, 'csv').write(tables, spec)
+            with open(os.path.join(output_dir, MANIFEST_FILE), encoding='utf-8') as f:
+                self.assertEqual(json.load(f)["shards"], 3)
+
+            rows_by_table = {}
+            level_by_table = {}
+            for level in manifest["levels"]:
+                for table_entry in level["tables"]:
+                    level_by_table[table_entry["table"]] = level["level"]
+                    rows = []
+                    for file_entry in table_entry["files"]:
+                        with open(os.path.join(output_dir, file_entry["path"]), encoding='utf-8', newline='') as f:
+                            rows.extend(csv.DictReader(f))
+                    rows_by_table[table_entry["table"]] = rows
+
+        self.assertEqual(len(rows_by_table["EmployeeProjects"]), 30)
+        for column, parent, parent_column in (("employee_id", "Employees", "employee_id"),
+                                              ("project_id", "Projects", "project_id")):
+            self.assertLess(level_by_table[parent], level_by_table["EmployeeProjects"])
+            parent_values = {row[parent_column] for row in rows_by_table[parent]}
+            child_values = [row[column] for row in rows_by_table["EmployeeProjects"]]
+            self.assertTrue(set(child_values) <= parent_values)
+            self.assertEqual(len(child_values), len(set(child_values)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from datetime import date
+from src.core.models.table import Table
+from src.core.services.predefined_values import PredefinedValues
+from src.core.services.sql_generator import SQLGenerator, quote_sql_string
+from test.stub_repository import StubValueRepository
+
+
+class PartitionRowsTest(unittest.TestCase):
+    def setUp(self):
+        self.generator = SQLGenerator(PredefinedValues(StubValueRepository()))
+
+    def test_rows_are_split_into_contiguous_primary_key_ranges(self):
+        table = Table("T")
+        table.add_column("id", "Number [0,10000]")
+        table.set_primary_keys(["id"])
+        table.generated_rows = [{"id": value} for value in (7, 3, 9, 1, 5, 2, 8)]
+
+        shards = self.generator.partition_rows(table, 3)
+
+        self.assertEqual([[row["id"] for row in shard] for shard in shards], [[1, 2, 3], [5, 7], [8, 9]])
+
+    def test_rows_without_primary_key_keep_generation_order(self):
+        table = Table("T")
+        table.add_column("name", "First name")
+        table.generated_rows = [{"name": name} for name in ("c", "a", "b")]
+
+        shards = self.generator.partition_rows(table, 2)
+
+        self.assertEqual([[row["name"] for row in shard] for shard in shards], [["c", "a"], ["b"]])
+
+    def test_more_shards_than_rows_gives_empty_shards(self):
+        table = Table("T")
+        table.add_column("id", "Number [0,10000]")
+        table.set_primary_keys(["id"])
+        table.generated_rows = [{"id": 1}]
+
+        self.assertEqual(self.generator.partition_rows(table, 3), [[{"id": 1}], [], []])
+
+
+class UniqueValuesTest(unittest.TestCase):
+    def setUp(self):
+        self.repository = StubValueRepository()
+        self.repository.seed(0)
+        self.generator = SQLGenerator(PredefinedValues(self.repository))
+
+    def test_unique_foreign_key_is_drawn_from_parent_values(self):
+        parent = Table("Parent")
+        parent.add_column("id", "Number [0,10000]")
+        parent.set_primary_keys(["id"])
+        child = Table("Child")
+        child.add_column("id", "Number [0,10000]")
+        child.set_primary_keys(["id"])
+        child.add_foreign_key("id", "Parent", "id")
+
+        for _ in range(20):
+            self.generator.generate_row(parent, {})
+        for _ in range(20):
+            self.generator.generate_row(child, {"Parent": parent})
+
+        parent_ids = {row["id"] for row in parent.generated_rows}
+        child_ids = [row["id"] for row in child.generated_rows]
+        self.assertEqual(set(child_ids), parent_ids)
+
+    def test_demand_equal_to_pool_uses_every_value(self):
+        table = Table("T")
+        table.add_column("id", "Number [0,10]")
+        table.set_primary_keys(["id"])
+
+        for _ in range(11):
+            self.generator.generate_row(table, {})
+
+        self.assertEqual(sorted(row["id"] for row in table.generated_rows), list(range(11)))
+        with self.assertRaises(ValueError):
+            self.generator.generate_row(table, {})
+
+    def test_regenerated_parent_with_same_name_is_not_stale(self):
+        child = Table("Child")
+        child.add_column("parent_id", "Number [0,10000]")
+        child.add_foreign_key("parent_id", "Parent", "id")
+
+        for parent_ids in ([1, 2, 3], [7, 8, 9]):
+            parent = Table("Parent")
+            parent.add_column("id", "Number [0,10000]")
+            parent.generated_rows = [{"id": value} for value in parent_ids]
+            child.generated_rows = []
+            for _ in range(20):
+                self.generator.generate_row(child, {"Parent": parent})
+
+            self.assertLessEqual({row["parent_id"] for row in child.generated_rows}, set(parent_ids))
+
+    def test_replaced_generated_rows_rebuild_column_index(self):
+        table = Table("T")
+        table.add_column("id", "Number [0,10000]")
+        table.generated_rows = [{"id": 1}, {"id": 2}]
+        self.assertEqual(table.column_values("id"), [1, 2])
+
+        table.generated_rows = [{"id": 5}, {"id": 6}]
+
+        self.assertEqual(table.column_values("id"), [5, 6])
+
+
+class FormatValueTest(unittest.TestCase):
+    def setUp(self):
+        self.generator = SQLGenerator(PredefinedValues(StubValueRepository()))
+
+    def test_quotes_inside_strings_are_doubled(self):
+        self.assertEqual(quote_sql_string("O'Connor"), "'O''Connor'")
+        self.assertEqual(self.generator.format_value("Last name", "O'Connor"), "'O''Connor'")
+
+    def test_numbers_are_not_quoted(self):
+        self.assertEqual(self.generator.format_value("Number [0,10000]", 42), "42")
+
+    def test_date_literal_is_cached_per_date(self):
+        first = self.generator.format_value("Date", date(2020, 1, 2))
+        second = self.generator.format_value("Recent date", date(2020, 1, 2))
+
+        self.assertEqual(first, "to_date('2020-01-02', 'YYYY-MM-DD')")
+        self.assertIs(first, second)
+
+    def test_date_in_numeric_foreign_key_column_is_rendered_as_date(self):
+        # Внешние ключи получают тип "Number [0,10000]", даже если ссылаются на столбец с датами
+        self.assertEqual(self.generator.format_value("Number [0,10000]", date(2020, 1, 2)),
+                         "to_date('2020-01-02', 'YYYY-MM-DD')")
+
+    def test_insert_query_renders_native_values(self):
+        table = Table("People")
+        table.add_column("name", "Last name")
+        table.add_column("born", "Date")
+        table.add_column("age", "Number [0,10]")
+
+        query = self.generator.build_insert_query(table, {"name": "O'Connor", "born": date(2020, 1, 2), "age": 3})
+
+        self.assertEqual(query, "INSERT INTO People (name, born, age) "
+                                "VALUES ('O''Connor', to_date('2020-01-02', 'YYYY-MM-DD'), 3);")
+
+
+if __name__ == '__main__':
+    unittest.main()
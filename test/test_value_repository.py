@@ -0,0 +1,27 @@
+import unittest
+from datetime import date
+from src.core.repositories.value_repository import ValueRepository
+
+
+class ParseValuesTest(unittest.TestCase):
+    def setUp(self):
+        self.repository = ValueRepository()
+
+    def test_numbers_are_parsed_to_int(self):
+        self.assertEqual(self.repository._parse_values("Number [0,10]", ["0", "7", "10"]), [0, 7, 10])
+
+    def test_dates_are_parsed_to_date(self):
+        self.assertEqual(self.repository._parse_values("Date", ["2020-01-02"]), [date(2020, 1, 2)])
+
+    def test_unparsable_values_are_kept_as_text(self):
+        with self.assertLogs("src.core.repositories.value_repository", level="WARNING"):
+            values = self.repository._parse_values("Recent date", ["2020-01-02", "yesterday"])
+
+        self.assertEqual(values, [date(2020, 1, 2), "yesterday"])
+
+    def test_other_field_types_stay_strings(self):
+        self.assertEqual(self.repository._parse_values("City", ["Paris", "42"]), ["Paris", "42"])
+
+
+if __name__ == '__main__':
+    unittest.main()